@@ -1,12 +1,14 @@
 # Standard library imports
-import os
+import io
+import re
 import json
+import bisect
 import asyncio
 import logging
-import tempfile
 import base64
 from datetime import datetime, timedelta
-from typing import Optional, List, Set
+from time import perf_counter  # Several commands take a `time` argument
+from typing import Optional, List, Set, Tuple, Iterable, Iterator
 
 # Discord imports
 import discord
@@ -15,6 +17,7 @@ from discord import app_commands
 # Local imports
 from health_check import HealthCheck
 from config import (
+    AnnouncementSettings,
     ConfigManager,
     TimerCategory,
     TTSLanguage,
@@ -29,22 +32,205 @@ from services import TTSService, VoiceService
 
 logger = logging.getLogger('PredTimer.Commands')
 
+# Autocomplete candidates are static, so sort them once at import time
+# (Indian/Hindi first, then esports presets) and only filter per keystroke.
+# Each entry is (value, description, value_lower, description_lower).
+_PRESETS_SORTED = tuple(
+    (preset_id, description, preset_id.lower(), description.lower())
+    for preset_id, description in sorted(
+        ((preset_id, config['description']) for preset_id, config in VOICE_PRESETS.items()),
+        key=lambda x: (
+            0 if 'indian' in x[0].lower() or 'hindi' in x[0].lower() else 1,
+            1 if 'esports' in x[0].lower() or 'hype' in x[0].lower() else 2,
+            x[0]
+        )
+    )
+)
+_VOICES_SORTED = tuple(
+    (voice_id, description, voice_id.lower(), description.lower())
+    for voice_id, description in sorted(
+        EDGE_TTS_VOICES.items(),
+        key=lambda x: (0 if 'Indian' in x[1] or 'Hindi' in x[1] else 1, x[1])
+    )
+)
+
+
+# Preset speeds for set_tts autocomplete: (value, name, name_lower, value_str)
+_SPEED_PRESETS = tuple(
+    (value, name, name.lower(), str(value)) for value, name in (
+        (0.5, "Very Slow (0.5x)"),
+        (0.75, "Slow (0.75x)"),
+        (1.0, "Normal (1.0x)"),
+        (1.25, "Fast (1.25x)"),
+        (1.5, "Very Fast (1.5x)"),
+        (1.75, "Faster (1.75x)"),
+        (2.0, "Maximum (2.0x)")
+    )
+)
+
+_ADMINISTRATOR_BIT = discord.Permissions(administrator=True).value  # 0x8
+
+# Discord's per-message embed limits
+_EMBEDS_PER_MESSAGE = 10
+_EMBED_CHARS_PER_MESSAGE = 6000
+
+_MIN_CATEGORY_PREFIX = 2  # Characters typed before category autocomplete filters
+
+_VALID_CATEGORY_VALUES = frozenset(cat.value for cat in TimerCategory)
+# Shared by every command that takes a timer category
+_CATEGORY_CHOICES = [
+    app_commands.Choice(name=cat.name.title(), value=cat.value)
+    for cat in TimerCategory
+]
+_VALID_LANG_ACCENT_SET = frozenset(VALID_LANG_ACCENT_PAIRS)
+
+# Settings holding lists of Discord IDs, sanitized the same way on import
+_ID_LIST_SETTINGS = ('admin_roles', 'admin_users', 'secondary_owners')
+
+# Numeric TTS settings accepted on import: (key, type, default, min, max)
+_TTS_NUMERIC_FIELDS = (
+    ('warning_time', int, 30, 0, 60),
+    ('speed', float, 1.0, 0.5, 2.0),
+    ('pitch', float, 1.0, 0.5, 2.0),
+)
+_DEFAULT_CATEGORY = TimerCategory.REMINDER.value
+_MAX_TIMER_MESSAGES = 32  # Messages kept per imported timer
+_MAX_TIMERS = 1024  # Timers accepted in one imported config
+_MAX_CONFIG_BYTES = 1024 * 1024  # 1MB limit on uploaded config files
+
+# Caps how many uploaded configs are parsed at once so a burst of imports
+# can't tie up the default thread pool that config saves also run on
+_IMPORT_SEMAPHORE = asyncio.Semaphore(4)
+
+# Import summary "Merge Details" text, indexed by whether existing timers were kept
+_MERGE_DETAILS = (
+    "✓ Merged with existing configuration\n✗ Replaced existing timers\n",
+    "✓ Merged with existing configuration\n✓ Kept existing timers\n",
+)
+
+
+def _coerce_clamped(value, cast, default, low, high):
+    """Coerce a raw config value with cast and clamp it to [low, high]."""
+    try:
+        return max(low, min(high, cast(value)))
+    except (ValueError, TypeError):
+        return default
+
+
+# Discord snowflakes are unsigned 64-bit, so at most 20 ASCII digits
+_match_id = re.compile(r'[0-9]{1,20}').fullmatch
+
+
+# Game times are M:SS; seconds must be two digits below 60
+_match_time = re.compile(r'([0-9]{1,3}):([0-5][0-9])').fullmatch
+
+
+def _parse_time(time: str) -> Optional[int]:
+    """Parse an M:SS game time into seconds, or None if it is malformed."""
+    match = _match_time(time.strip())
+    if match is None:
+        return None
+    return int(match[1]) * 60 + int(match[2])
+
+
+def _coerce_id(value) -> Optional[int]:
+    """Coerce a Discord ID from an imported config, or None if it isn't one."""
+    if type(value) is int:
+        return value if value >= 0 else None
+    if isinstance(value, str) and _match_id(value):
+        return int(value)
+    return None
+
+
+def _coerce_id_list(values: list) -> List[int]:
+    """Coerce a list of Discord IDs from an imported config, dropping invalid entries."""
+    return [i for i in map(_coerce_id, values) if i is not None]
+
+
+def _batch_embeds(embeds: Iterable[discord.Embed]) -> Iterator[List[discord.Embed]]:
+    """
+    Group embeds into per-message batches within Discord's limits of
+    10 embeds and 6000 characters across all embeds in one message.
+    Each batch is yielded as soon as it is full, so sending can start early.
+    """
+    batch, batch_size = [], 0
+    for embed in embeds:
+        size = len(embed)
+        if batch and (len(batch) == _EMBEDS_PER_MESSAGE or batch_size + size > _EMBED_CHARS_PER_MESSAGE):
+            yield batch
+            batch, batch_size = [], 0
+        batch.append(embed)
+        batch_size += size
+    if batch:
+        yield batch
+
+
+def _timer_pages(timer_fields: Tuple[Tuple[str, str], ...],
+                 category: Optional[str]) -> Iterator[discord.Embed]:
+    """Build list_timers embeds of 25 fields each, one page at a time."""
+    chunk_size = 25
+    page_count = -(-len(timer_fields) // chunk_size)
+    for i in range(page_count):
+        embed = discord.Embed(
+            title=f"Configured Timers (Page {i+1}/{page_count})",
+            color=discord.Color.blue()
+        )
+
+        if category:
+            embed.description = f"Filtered by category: {category}"
+
+        # Add timer fields for this page, sliced from the cached listing
+        for field_name, field_value in timer_fields[i * chunk_size:(i + 1) * chunk_size]:
+            embed.add_field(
+                name=field_name,
+                value=field_value,
+                inline=False
+            )
+
+        yield embed
+
+
 class GameCommands(app_commands.Group):
     """Handles all game-related commands for the bot."""
+
+    _logged_commands = False  # Set once the command list has been logged
     
     def __init__(self, bot):
         super().__init__(name="pred", description="pred game timer commands")
         self.bot = bot
+        self._playback_tasks: Set[asyncio.Task] = set()  # Keep background playback alive until done
         
-        # Log all registered commands
-        logger.info("Registering bot commands:")
-        # Get all methods that are commands
-        for name, method in self.__class__.__dict__.items():
-            if isinstance(method, app_commands.Command):
-                logger.info(f"  /pred {method.name} - {method.description}")
+        # Log all registered commands, once per process rather than per instantiation
+        if not GameCommands._logged_commands:
+            logger.info("Registering bot commands:")
+            # Get all methods that are commands
+            for name, method in self.__class__.__dict__.items():
+                if isinstance(method, app_commands.Command):
+                    logger.info(f"  /pred {method.name} - {method.description}")
+            GameCommands._logged_commands = True
         
         logger.info("GameCommands initialization complete")
 
+    def _start_playback(self, interaction: discord.Interaction,
+                        voice_client: discord.VoiceClient,
+                        message: str, settings: AnnouncementSettings) -> None:
+        """Play an announcement in the background, reporting failures on the interaction."""
+        async def playback():
+            try:
+                await self.bot.voice_service.play_announcement(voice_client, message, settings)
+            except Exception as e:
+                logger.error("Error in voice connection/playback: %s", e)
+                try:
+                    await interaction.edit_original_response(
+                        content=f"Error playing message: {str(e)}"
+                    )
+                except discord.HTTPException:
+                    pass  # Interaction token expired or the response was deleted
+
+        task = asyncio.create_task(playback())
+        self._playback_tasks.add(task)
+        task.add_done_callback(self._playback_tasks.discard)
+
     async def check_permissions(self, interaction: discord.Interaction) -> bool:
         """Check if user has permission to use admin commands."""
         # Guard against DM usage
@@ -56,41 +242,57 @@ class GameCommands(app_commands.Group):
         if interaction.user.id == interaction.guild.owner_id:
             return True
 
-        # Check if user has Discord's Administrator permission (auto-grant)
-        if interaction.user.guild_permissions.administrator:
-            logger.debug(f"Permission granted via Discord Administrator: {interaction.user.id} in guild {interaction.guild.id}")
+        # Check if user has Discord's Administrator permission (auto-grant).
+        # interaction.permissions arrives resolved in the interaction payload,
+        # whereas guild_permissions recomputes it from every role the member has;
+        # test the raw bit rather than going through the flag descriptor
+        if interaction.permissions.value & _ADMINISTRATOR_BIT:
+            logger.debug("Permission granted via Discord Administrator: %s in guild %s", interaction.user.id, interaction.guild.id)
             return True
 
-        # Check configured admin users and roles
-        config = self.bot.config_manager.get_server_config(interaction.guild.id)
-        settings = config.get('settings', {})
-
-        # Combine admin_users, secondary_owners, and bot_inviter
-        authorized_users = set(settings.get('admin_users', []))
-        authorized_users.update(settings.get('secondary_owners', []))
-
-        # Add bot inviter if recorded
-        bot_inviter = settings.get('bot_inviter')
-        if bot_inviter:
-            authorized_users.add(bot_inviter)
-
+        # Check configured admin users, secondary owners and the bot inviter
+        config_manager = self.bot.config_manager
+        authorized_users = config_manager.get_authorized_user_set(interaction.guild.id)
         if interaction.user.id in authorized_users:
             return True
 
-        # Check role-based permissions (custom admin roles)
-        admin_roles = set(settings.get('admin_roles', []))
-        user_role_ids = {role.id for role in interaction.user.roles}
-
-        if admin_roles & user_role_ids:  # Set intersection
-            return True
+        # Check role-based permissions (custom admin roles); members whose only
+        # role is @everyone can't match, so skip the lookup entirely
+        roles = interaction.user.roles
+        if len(roles) > 1:
+            admin_roles = config_manager.get_admin_role_set(interaction.guild.id)
+            # isdisjoint consumes the generator lazily and stops at the first admin role
+            if admin_roles and not admin_roles.isdisjoint(role.id for role in roles):
+                return True
 
         # Log denial for debugging
         logger.debug(
-            f"Permission denied: user={interaction.user.id} ({interaction.user.name}) "
-            f"guild={interaction.guild.id} command={interaction.command.name if interaction.command else 'unknown'}"
+            "Permission denied: user=%s (%s) guild=%s command=%s",
+            interaction.user.id, interaction.user.name, interaction.guild.id,
+            interaction.command.name if interaction.command else 'unknown'
         )
         return False
 
+    def parse_config(self, config_bytes: bytes) -> tuple[bool, str, dict]:
+        """
+        Decode an uploaded configuration file and validate it in one pass.
+        Returns (is_valid, error_message, sanitized_config)
+        """
+        # The attachment size is checked up front, but trust only the bytes received
+        if len(config_bytes) > _MAX_CONFIG_BYTES:
+            return False, "File too large. Configuration files should be under 1MB.", {}
+
+        try:
+            # json.loads detects the encoding of raw bytes
+            config_data = json.loads(config_bytes)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return False, "Invalid JSON format. Please ensure the file contains valid JSON.", {}
+
+        is_valid, error_message, sanitized = self.validate_config(config_data)
+        if not is_valid:
+            return False, f"Invalid configuration: {error_message}", {}
+        return True, "", sanitized
+
     def validate_config(self, config_data: dict) -> tuple[bool, str, dict]:
         """
         Validate configuration data and sanitize it.
@@ -102,9 +304,18 @@ class GameCommands(app_commands.Group):
             if not isinstance(config_data, dict):
                 return False, "Configuration must be a dictionary", {}
             
-            if not all(key in config_data for key in required_keys):
+            if not required_keys <= config_data.keys():
                 return False, f"Configuration missing required sections: {required_keys}", {}
 
+            # Reject oversized timer sections before walking any of them
+            timers = config_data['timers']
+            if not isinstance(timers, dict):
+                return False, "Timers section must be a dictionary", {}
+            if len(timers) > _MAX_TIMERS:
+                return False, f"Too many timers (maximum {_MAX_TIMERS})", {}
+            if not timers:
+                return False, "No valid timers found in configuration", {}
+
             # Initialize sanitized config with default structure
             sanitized = {
                 'settings': {
@@ -129,6 +340,8 @@ class GameCommands(app_commands.Group):
                 },
                 'timers': {}
             }
+            sanitized_settings = sanitized['settings']
+            sanitized_tts = sanitized_settings['tts_settings']
 
             # Validate settings section
             settings = config_data.get('settings', {})
@@ -136,86 +349,63 @@ class GameCommands(app_commands.Group):
                 return False, "Settings section must be a dictionary", {}
 
             # Volume validation
-            try:
-                volume = float(settings.get('volume', 1.0))
-                sanitized['settings']['volume'] = max(0.0, min(1.0, volume))
-            except (ValueError, TypeError):
-                sanitized['settings']['volume'] = 1.0
-
-            # Admin roles validation
-            admin_roles = settings.get('admin_roles', [])
-            if isinstance(admin_roles, list):
-                sanitized['settings']['admin_roles'] = [
-                    int(role_id) for role_id in admin_roles 
-                    if str(role_id).isdigit()
-                ]
-                
-            # Admin users validation
-            admin_users = settings.get('admin_users', [])
-            if isinstance(admin_users, list):
-                sanitized['settings']['admin_users'] = [
-                    int(user_id) for user_id in admin_users
-                    if str(user_id).isdigit()
-                ]
-
-            # Secondary owners validation
-            secondary_owners = settings.get('secondary_owners', [])
-            if isinstance(secondary_owners, list):
-                sanitized['settings']['secondary_owners'] = [
-                    int(user_id) for user_id in secondary_owners
-                    if str(user_id).isdigit()
-                ]
+            sanitized_settings['volume'] = _coerce_clamped(
+                settings.get('volume', 1.0), float, 1.0, 0.0, 1.0
+            )
+
+            # Admin roles, admin users and secondary owners validation
+            for key in _ID_LIST_SETTINGS:
+                ids = settings.get(key, [])
+                if isinstance(ids, list):
+                    sanitized_settings[key] = _coerce_id_list(ids)
 
             # Bot inviter validation
-            bot_inviter = settings.get('bot_inviter')
-            if bot_inviter is not None and str(bot_inviter).isdigit():
-                sanitized['settings']['bot_inviter'] = int(bot_inviter)
-            else:
-                sanitized['settings']['bot_inviter'] = None
+            sanitized_settings['bot_inviter'] = _coerce_id(settings.get('bot_inviter'))
 
             # TTS settings validation
             tts_settings = settings.get('tts_settings', {})
             if not isinstance(tts_settings, dict):
                 tts_settings = {}
 
-            # Voice name validation (Edge-TTS)
-            voice_name = str(tts_settings.get('voice_name', 'en-IN-NeerjaNeural'))
-            if voice_name and isinstance(voice_name, str):
-                sanitized['settings']['tts_settings']['voice_name'] = voice_name
+            # Voice name validation (Edge-TTS); only non-empty strings are kept,
+            # rather than stringifying whatever value was imported
+            voice_name = tts_settings.get('voice_name')
+            if type(voice_name) is str and voice_name:
+                sanitized_tts['voice_name'] = voice_name
             else:
-                sanitized['settings']['tts_settings']['voice_name'] = 'en-IN-NeerjaNeural'
+                sanitized_tts['voice_name'] = 'en-IN-NeerjaNeural'
 
             # Language and accent validation (kept for backwards compatibility)
             language = str(tts_settings.get('language', 'en'))
             accent = str(tts_settings.get('accent', 'co.in'))
 
             # Check if language-accent pair is valid
-            if (language, accent) in VALID_LANG_ACCENT_PAIRS:
-                sanitized['settings']['tts_settings']['language'] = language
-                sanitized['settings']['tts_settings']['accent'] = accent
+            if (language, accent) in _VALID_LANG_ACCENT_SET:
+                sanitized_tts['language'] = language
+                sanitized_tts['accent'] = accent
             
             # Other TTS settings validation
-            try:
-                warning_time = int(tts_settings.get('warning_time', 30))
-                sanitized['settings']['tts_settings']['warning_time'] = max(0, min(60, warning_time))
-            except (ValueError, TypeError):
-                sanitized['settings']['tts_settings']['warning_time'] = 30
-
-            try:
-                speed = float(tts_settings.get('speed', 1.0))
-                sanitized['settings']['tts_settings']['speed'] = max(0.5, min(2.0, speed))
-            except (ValueError, TypeError):
-                sanitized['settings']['tts_settings']['speed'] = 1.0
+            for key, cast, default, low, high in _TTS_NUMERIC_FIELDS:
+                sanitized_tts[key] = _coerce_clamped(
+                    tts_settings.get(key, default), cast, default, low, high
+                )
 
             # Timers validation
-            timers = config_data.get('timers', {})
-            if not isinstance(timers, dict):
-                return False, "Timers section must be a dictionary", {}
-
             for name, timer in timers.items():
                 if not isinstance(timer, dict):
                     continue
 
+                # Reject missing or out-of-range times before touching messages;
+                # plain ints (the usual case) skip the conversion entirely
+                time_value = timer.get('time')
+                if type(time_value) is not int:
+                    try:
+                        time_value = int(time_value)  # None raises TypeError
+                    except (ValueError, TypeError):
+                        continue
+                if not 0 <= time_value <= 3600:  # Max 1 hour
+                    continue
+
                 # Check for either messages array or single message
                 messages = timer.get('messages', [timer.get('message', 'Timer event')])
                 if isinstance(messages, str):
@@ -223,32 +413,22 @@ class GameCommands(app_commands.Group):
                 elif not isinstance(messages, list):
                     continue
 
-                try:
-                    time_value = int(timer['time'])
-                    if not 0 <= time_value <= 3600:  # Max 1 hour
-                        continue
-                        
-                    # Validate message length and content
-                    valid_messages = []
-                    for msg in messages:
-                        msg = str(msg).strip()
-                        if msg and len(msg) <= 200:  # Message length limit
-                            valid_messages.append(msg)
-                    
-                    if not valid_messages:
-                        valid_messages = ['Timer event']
-
-                    category = str(timer.get('category', TimerCategory.REMINDER.value))
-                    if category not in [cat.value for cat in TimerCategory]:
-                        category = TimerCategory.REMINDER.value
-
-                    sanitized['timers'][str(name)] = {
-                        'time': time_value,
-                        'messages': valid_messages,
-                        'category': category
-                    }
-                except (ValueError, TypeError, KeyError):
-                    continue
+                # Validate message length and content (skip str() for strings);
+                # only the first _MAX_TIMER_MESSAGES entries are considered
+                valid_messages = [
+                    msg for raw in messages[:_MAX_TIMER_MESSAGES]
+                    if 0 < len(msg := raw.strip() if type(raw) is str else str(raw).strip()) <= 200
+                ] or ['Timer event']
+
+                category = timer.get('category', _DEFAULT_CATEGORY)
+                if type(category) is not str or category not in _VALID_CATEGORY_VALUES:
+                    category = _DEFAULT_CATEGORY
+
+                sanitized['timers'][str(name)] = {
+                    'time': time_value,
+                    'messages': valid_messages,
+                    'category': category
+                }
 
             if not sanitized['timers']:
                 return False, "No valid timers found in configuration", {}
@@ -256,7 +436,7 @@ class GameCommands(app_commands.Group):
             return True, "", sanitized
 
         except Exception as e:
-            logger.error(f"Error validating configuration: {e}")
+            logger.error("Error validating configuration: %s", e)
             return False, f"Error validating configuration: {str(e)}", {}
 
 
@@ -271,7 +451,7 @@ class GameCommands(app_commands.Group):
             return
 
         config = self.bot.config_manager.get_server_config(interaction.guild.id)
-        admin_users = config['settings'].get('admin_users', [])
+        admin_users = set(config['settings']['admin_users'])
         
         if user.id in admin_users:
             await interaction.response.send_message(
@@ -280,11 +460,12 @@ class GameCommands(app_commands.Group):
             )
             return
 
-        admin_users.append(user.id)
+        # Write back a fresh sorted list so the stored file stays deduplicated and stable
+        admin_users.add(user.id)
         self.bot.config_manager.update_server_setting(
             interaction.guild.id,
             'settings.admin_users',
-            admin_users
+            sorted(admin_users)
         )
         
         await interaction.response.send_message(
@@ -312,21 +493,14 @@ class GameCommands(app_commands.Group):
 
         preset_config = VOICE_PRESETS[preset]
 
-        # Update all TTS settings from preset
-        self.bot.config_manager.update_server_setting(
-            interaction.guild.id,
-            'settings.tts_settings.voice_name',
-            preset_config['voice_name']
-        )
-        self.bot.config_manager.update_server_setting(
+        # Update all TTS settings from preset in one write
+        self.bot.config_manager.update_server_settings(
             interaction.guild.id,
-            'settings.tts_settings.speed',
-            preset_config['speed']
-        )
-        self.bot.config_manager.update_server_setting(
-            interaction.guild.id,
-            'settings.tts_settings.pitch',
-            preset_config['pitch']
+            {
+                'settings.tts_settings.voice_name': preset_config['voice_name'],
+                'settings.tts_settings.speed': preset_config['speed'],
+                'settings.tts_settings.pitch': preset_config['pitch']
+            }
         )
 
         # Create response embed
@@ -359,24 +533,15 @@ class GameCommands(app_commands.Group):
     @voice_preset.autocomplete('preset')
     async def preset_autocomplete(self, interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
         """Autocomplete for voice presets."""
-        # Filter presets based on current input
-        filtered = [
-            (preset_id, config['description'])
-            for preset_id, config in VOICE_PRESETS.items()
-            if current.lower() in preset_id.lower() or current.lower() in config['description'].lower()
-        ]
-
-        # Sort to show Indian presets first
-        filtered.sort(key=lambda x: (
-            0 if 'indian' in x[0].lower() or 'hindi' in x[0].lower() else 1,
-            1 if 'esports' in x[0].lower() or 'hype' in x[0].lower() else 2,
-            x[0]
-        ))
-
-        return [
-            app_commands.Choice(name=description, value=preset_id)
-            for preset_id, description in filtered[:25]
-        ]
+        # Filter the pre-sorted presets based on current input, stopping at a full page
+        current = current.lower()
+        choices = []
+        for preset_id, description, preset_lower, description_lower in _PRESETS_SORTED:
+            if current in preset_lower or current in description_lower:
+                choices.append(app_commands.Choice(name=description, value=preset_id))
+                if len(choices) == 25:  # Discord limits to 25 choices
+                    break
+        return choices
 
     @app_commands.command(name="set_voice")
     @app_commands.describe(
@@ -423,23 +588,15 @@ class GameCommands(app_commands.Group):
     @set_voice.autocomplete('voice')
     async def voice_autocomplete(self, interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
         """Autocomplete for available voices."""
-        # Filter voices based on current input
-        filtered = [
-            (voice_id, description)
-            for voice_id, description in EDGE_TTS_VOICES.items()
-            if current.lower() in voice_id.lower() or current.lower() in description.lower()
-        ]
-
-        # Sort to show Indian voices first
-        filtered.sort(key=lambda x: (
-            0 if 'Indian' in x[1] or 'Hindi' in x[1] else 1,
-            x[1]
-        ))
-
-        return [
-            app_commands.Choice(name=description, value=voice_id)
-            for voice_id, description in filtered[:25]  # Discord limits to 25 choices
-        ]
+        # Filter the pre-sorted voices based on current input, stopping at a full page
+        current = current.lower()
+        choices = []
+        for voice_id, description, voice_lower, description_lower in _VOICES_SORTED:
+            if current in voice_lower or current in description_lower:
+                choices.append(app_commands.Choice(name=description, value=voice_id))
+                if len(choices) == 25:  # Discord limits to 25 choices
+                    break
+        return choices
 
     @app_commands.command(name="set_tts")
     @app_commands.describe(
@@ -456,54 +613,53 @@ class GameCommands(app_commands.Group):
             await interaction.response.send_message("You don't have permission to modify settings!", ephemeral=True)
             return
 
-        # Get current settings first
-        config = self.bot.config_manager.get_server_config(interaction.guild.id)
-        current_settings = config['settings'].get('tts_settings', {})
+        # Validate speed
+        if speed is not None and not 0.5 <= speed <= 2.0:
+            await interaction.response.send_message(
+                "Speed must be between 0.5 (half speed) and 2.0 (double speed)",
+                ephemeral=True
+            )
+            return
 
-        # Prepare new settings, starting with current settings
-        settings = current_settings.copy()
+        # Validate pitch
+        if pitch is not None and not 0.5 <= pitch <= 2.0:
+            await interaction.response.send_message(
+                "Pitch must be between 0.5 (low) and 2.0 (high)",
+                ephemeral=True
+            )
+            return
 
-        # Validate speed and update
+        changes = {}
         if speed is not None:
-            if 0.5 <= speed <= 2.0:
-                settings['speed'] = speed
-            else:
-                await interaction.response.send_message(
-                    "Speed must be between 0.5 (half speed) and 2.0 (double speed)",
-                    ephemeral=True
-                )
-                return
-
-        # Validate pitch and update
+            changes['speed'] = speed
         if pitch is not None:
-            if 0.5 <= pitch <= 2.0:
-                settings['pitch'] = pitch
-            else:
-                await interaction.response.send_message(
-                    "Pitch must be between 0.5 (low) and 2.0 (high)",
-                    ephemeral=True
-                )
-                return
-
+            changes['pitch'] = pitch
         if warning_time is not None:
-            settings['warning_time'] = max(0, min(60, warning_time))
+            changes['warning_time'] = max(0, min(60, warning_time))
 
-        # Update the settings
-        self.bot.config_manager.update_server_setting(
-            interaction.guild.id,
-            'settings.tts_settings',
-            settings
-        )
+        # Write only the values that differ from what's stored, without copying
+        # the TTS settings; a call that changes nothing skips the save entirely
+        config = self.bot.config_manager.get_server_config(interaction.guild.id)
+        current_settings = config['settings']['tts_settings']
+        updates = {
+            f'settings.tts_settings.{key}': value
+            for key, value in changes.items()
+            if current_settings.get(key) != value
+        }
+        if updates:
+            self.bot.config_manager.update_server_settings(interaction.guild.id, updates)
 
         # Create response embed
         embed = discord.Embed(
-            title="TTS Settings Updated",
+            title="TTS Settings Updated" if updates else "TTS Settings",
             color=discord.Color.green()
         )
 
+        # Read back the stored values through the cached snapshot, which fills in defaults
+        voice = self.bot.config_manager.get_announcement_settings(interaction.guild.id)
+
         # Get current voice
-        voice_id = settings.get('voice_name', 'en-IN-NeerjaNeural')
-        voice_name = EDGE_TTS_VOICES.get(voice_id, voice_id)
+        voice_name = EDGE_TTS_VOICES.get(voice.voice_name, voice.voice_name)
 
         embed.add_field(
             name="Current Voice",
@@ -512,18 +668,18 @@ class GameCommands(app_commands.Group):
         )
         embed.add_field(
             name="Speed",
-            value=f"{settings.get('speed', 1.0)}x",
+            value=f"{voice.speed}x",
             inline=True
         )
         embed.add_field(
             name="Pitch",
-            value=f"{settings.get('pitch', 1.0)}x",
+            value=f"{voice.pitch}x",
             inline=True
         )
         if warning_time is not None:
             embed.add_field(
                 name="Warning Time",
-                value=f"{settings.get('warning_time', 30)}s",
+                value=f"{voice.warning_time}s",
                 inline=True
             )
 
@@ -534,68 +690,51 @@ class GameCommands(app_commands.Group):
     @set_tts.autocomplete('speed')
     async def speed_autocomplete(self, interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
         """Autocomplete for TTS speed."""
-        # Define preset speeds with descriptions
-        preset_speeds = [
-            (0.5, "Very Slow (0.5x)"),
-            (0.75, "Slow (0.75x)"),
-            (1.0, "Normal (1.0x)"),
-            (1.25, "Fast (1.25x)"),
-            (1.5, "Very Fast (1.5x)"),
-            (1.75, "Faster (1.75x)"),
-            (2.0, "Maximum (2.0x)")
+        current_lower = current.lower()
+
+        # Filter presets based on current input (match against both speed value and description)
+        choices = [
+            app_commands.Choice(name=name, value=value)
+            for value, name, name_lower, value_str in _SPEED_PRESETS
+            if current_lower in value_str or current_lower in name_lower
         ]
-        
-        # If user has typed something, try to parse it
+
+        # If user has typed something, try to parse it as a custom speed
         if current:
             try:
                 value = float(current)
                 # If it's a valid number, add it to choices if in valid range
                 if 0.5 <= value <= 2.0:
-                    preset_speeds.append((value, f"Custom ({value}x)"))
+                    choices.append(app_commands.Choice(name=f"Custom ({value}x)", value=value))
             except ValueError:
                 pass
 
-        # Convert current to string for filtering
-        current_str = str(current).lower()
-        
-        # Filter based on current input (match against both speed value and description)
-        filtered = [
-            (value, name) for value, name in preset_speeds
-            if current_str in str(value) or current_str in name.lower()
-        ]
-        
-        # Return formatted choices
-        return [
-            app_commands.Choice(name=name, value=float(value))
-            for value, name in filtered[:25]  # Discord limits to 25 choices
-        ]
+        return choices[:25]  # Discord limits to 25 choices
 
     @app_commands.command(name="settings")
     async def settings(self, interaction: discord.Interaction):
         """Show the current server settings."""
         config = self.bot.config_manager.get_server_config(interaction.guild.id)
-        settings = config.get('settings', {})
+        settings = config['settings']
+        # Cached snapshot with defaults already filled in
+        voice = self.bot.config_manager.get_announcement_settings(interaction.guild.id)
         embed = discord.Embed(title="Server Settings", color=discord.Color.blue())
 
-        embed.add_field(name="Volume", value=f"{settings.get('volume', 1.0):.1f}", inline=True)
+        embed.add_field(name="Volume", value=f"{voice.volume:.1f}", inline=True)
 
-        admin_roles = [f"<@&{rid}>" for rid in settings.get('admin_roles', [])]
-        admin_users = [f"<@{uid}>" for uid in settings.get('admin_users', [])]
-        bot_inviter = settings.get('bot_inviter')
+        admin_roles = ', '.join(f"<@&{rid}>" for rid in settings['admin_roles']) or "None"
+        admin_users = ', '.join(f"<@{uid}>" for uid in settings['admin_users']) or "None"
+        bot_inviter = settings['bot_inviter']
 
-        embed.add_field(name="Admin Roles", value=', '.join(admin_roles) if admin_roles else "None", inline=False)
-        embed.add_field(name="Admin Users", value=', '.join(admin_users) if admin_users else "None", inline=False)
+        embed.add_field(name="Admin Roles", value=admin_roles, inline=False)
+        embed.add_field(name="Admin Users", value=admin_users, inline=False)
 
         if bot_inviter:
             embed.add_field(name="Bot Inviter", value=f"<@{bot_inviter}>", inline=False)
 
-        tts = settings.get('tts_settings', {})
-        voice_name = tts.get('voice_name', 'en-IN-NeerjaNeural')
-        speed = tts.get('speed', 1.0)
-        pitch = tts.get('pitch', 1.0)
         embed.add_field(
             name="TTS Voice",
-            value=f"🎤 {voice_name}\n⚡ Speed: {speed}x | 🎵 Pitch: {pitch}x",
+            value=f"🎤 {voice.voice_name}\n⚡ Speed: {voice.speed}x | 🎵 Pitch: {voice.pitch}x",
             inline=False
         )
 
@@ -603,6 +742,16 @@ class GameCommands(app_commands.Group):
 
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
+    @app_commands.command(name="ping")
+    async def ping(self, interaction: discord.Interaction):
+        """Show the gateway latency and the response round-trip time."""
+        sent = perf_counter()
+        await interaction.response.send_message("Pinging…", ephemeral=True)
+        rtt = (perf_counter() - sent) * 1000
+        await interaction.edit_original_response(
+            content=f"🏓 WS: {self.bot.latency * 1000:.0f}ms | RTT: {rtt:.0f}ms"
+        )
+
     @app_commands.command(name="set_volume")
     async def set_volume(self, interaction: discord.Interaction, volume: float):
         """Set the announcement volume (0.0 - 1.0)."""
@@ -622,16 +771,17 @@ class GameCommands(app_commands.Group):
     @app_commands.command(name="test_voice")
     async def test_voice(self, interaction: discord.Interaction, message: Optional[str] = "This is a test"):
         """Play a test voice line using current settings."""
-        if not interaction.user.voice:
+        voice_state = interaction.user.voice
+        if voice_state is None:
             await interaction.response.send_message("You need to be in a voice channel!", ephemeral=True)
             return
 
-        voice_channel = interaction.user.voice.channel
+        voice_channel = voice_state.channel
         voice_client = await self.bot.voice_service.ensure_voice_client(voice_channel)
-        config = self.bot.config_manager.get_server_config(interaction.guild.id)
+        settings = self.bot.config_manager.get_announcement_settings(interaction.guild.id)
 
         await interaction.response.send_message("Playing test message...", ephemeral=True)
-        await self.bot.voice_service.play_announcement(voice_client, message, config['settings'])
+        await self.bot.voice_service.play_announcement(voice_client, message, settings)
 
     @app_commands.command(name="remove_admin")
     async def remove_admin(self, interaction: discord.Interaction, user: discord.User):
@@ -641,17 +791,17 @@ class GameCommands(app_commands.Group):
             return
 
         config = self.bot.config_manager.get_server_config(interaction.guild.id)
-        admin_users = config['settings'].get('admin_users', [])
+        admin_users = set(config['settings']['admin_users'])
 
         if user.id not in admin_users:
             await interaction.response.send_message(f"{user.name} is not an admin!", ephemeral=True)
             return
 
-        admin_users.remove(user.id)
+        admin_users.discard(user.id)
         self.bot.config_manager.update_server_setting(
             interaction.guild.id,
             'settings.admin_users',
-            admin_users
+            sorted(admin_users)
         )
 
         await interaction.response.send_message(f"Removed {user.name} from bot admins.", ephemeral=True)
@@ -663,18 +813,16 @@ class GameCommands(app_commands.Group):
             await interaction.response.send_message("You don't have permission to modify admin roles!", ephemeral=True)
             return
 
-        config = self.bot.config_manager.get_server_config(interaction.guild.id)
-        admin_roles = config['settings'].get('admin_roles', [])
+        admin_roles = self.bot.config_manager.get_admin_role_set(interaction.guild.id)
 
         if role.id in admin_roles:
             await interaction.response.send_message(f"{role.name} is already an admin role!", ephemeral=True)
             return
 
-        admin_roles.append(role.id)
         self.bot.config_manager.update_server_setting(
             interaction.guild.id,
             'settings.admin_roles',
-            admin_roles
+            sorted(admin_roles | {role.id})
         )
 
         await interaction.response.send_message(f"Added {role.name} as an admin role.", ephemeral=True)
@@ -697,9 +845,9 @@ class GameCommands(app_commands.Group):
 
             # Get current admin list for display
             config = self.bot.config_manager.get_server_config(interaction.guild.id)
-            settings = config.get('settings', {})
-            admin_users = settings.get('admin_users', [])
-            bot_inviter = settings.get('bot_inviter')
+            settings = config['settings']
+            admin_users = settings['admin_users']
+            bot_inviter = settings['bot_inviter']
 
             embed = discord.Embed(
                 title="Admin Sync Complete",
@@ -729,17 +877,14 @@ class GameCommands(app_commands.Group):
             await interaction.followup.send(embed=embed, ephemeral=True)
 
         except Exception as e:
-            logger.error(f"Error in sync_admins command: {e}")
+            logger.error("Error in sync_admins command: %s", e)
             await interaction.followup.send(
                 f"Error syncing admins: {str(e)}",
                 ephemeral=True
             )
 
     @app_commands.command(name="edit_timer")
-    @app_commands.choices(category=[
-        app_commands.Choice(name=cat.name.title(), value=cat.value)
-        for cat in TimerCategory
-    ])
+    @app_commands.choices(category=_CATEGORY_CHOICES)
     async def edit_timer(self, interaction: discord.Interaction,
                          name: str, time: str, message: Optional[str] = None,
                          category: str = TimerCategory.REMINDER.value):
@@ -754,10 +899,8 @@ class GameCommands(app_commands.Group):
             await interaction.response.send_message(f"Timer '{name}' not found", ephemeral=True)
             return
 
-        try:
-            minutes, seconds = map(int, time.split(':'))
-            total_seconds = minutes * 60 + seconds
-        except ValueError:
+        total_seconds = _parse_time(time)
+        if total_seconds is None:
             await interaction.response.send_message("Invalid time format. Use M:SS (e.g., 5:30)", ephemeral=True)
             return
 
@@ -782,21 +925,26 @@ class GameCommands(app_commands.Group):
     )
     async def start(self, interaction: discord.Interaction, time: str = "00:00", mode: str = "standard"):
         """Start the game timer."""
+        # Reject a malformed start time before paying for a voice connection
+        start_seconds = _parse_time(time)
+        if start_seconds is None:
+            await interaction.response.send_message("Invalid time format. Use M:SS (e.g., 0:05)")
+            return
+
         try:
-            if not interaction.user.voice:
+            voice_state = interaction.user.voice
+            if voice_state is None:
                 await interaction.response.send_message("You need to be in a voice channel!")
                 return
 
-            voice_channel = interaction.user.voice.channel
-            await self.bot.voice_service.ensure_voice_client(voice_channel, force_new=True)
+            voice_channel = voice_state.channel
+            await self.bot.voice_service.ensure_voice_client(voice_channel)
             
-            self.bot.timer.start(time, mode)
+            self.bot.timer.start(start_seconds, mode)
             await interaction.response.send_message(f"Game timer started at {time} in {mode} mode")
             
-        except ValueError:
-            await interaction.response.send_message("Invalid time format. Use M:SS (e.g., 0:05)")
         except Exception as e:
-            logger.error(f"Error in start command: {e}")
+            logger.error("Error in start command: %s", e)
             await interaction.response.send_message(f"Error: {str(e)}")
 
     @app_commands.command(name="stop")
@@ -804,17 +952,14 @@ class GameCommands(app_commands.Group):
         """Stop the game timer."""
         self.bot.timer.stop()
         
-        for voice_client in self.bot.voice_clients:
-            if voice_client.guild == interaction.guild:
-                await self.bot.voice_service.cleanup_voice_clients(interaction.guild)
+        # A guild has at most one voice client, tracked on the guild itself
+        if interaction.guild.voice_client:
+            await self.bot.voice_service.cleanup_voice_clients(interaction.guild)
             
         await interaction.response.send_message("Game timer stopped")
 
     @app_commands.command(name="add_timer")
-    @app_commands.choices(category=[
-        app_commands.Choice(name=cat.name.title(), value=cat.value)
-        for cat in TimerCategory
-    ])
+    @app_commands.choices(category=_CATEGORY_CHOICES)
     async def add_timer(self, interaction: discord.Interaction, 
                        name: str, time: str, message: str, 
                        category: str = TimerCategory.REMINDER.value):
@@ -823,19 +968,22 @@ class GameCommands(app_commands.Group):
             await interaction.response.send_message("You don't have permission to add timers!")
             return
 
-        try:
-            # Convert time string to seconds
-            minutes, seconds = map(int, time.split(':'))
-            total_seconds = minutes * 60 + seconds
+        # Convert time string to seconds
+        total_seconds = _parse_time(time)
+        if total_seconds is None:
+            await interaction.response.send_message("Invalid time format. Use M:SS (e.g., 5:30)")
+            return
 
+        try:
             # Get existing timer if it exists
             config = self.bot.config_manager.get_server_config(interaction.guild.id)
             existing_timer = config.get('timers', {}).get(name, {})
             
-            # Get existing messages or create new list
+            # Build a new message list rather than appending to the stored one,
+            # so the config only changes through update_timer
             messages = existing_timer.get('messages', [])
             if message not in messages:
-                messages.append(message)
+                messages = [*messages, message]
 
             self.bot.config_manager.update_timer(
                 interaction.guild.id,
@@ -848,13 +996,11 @@ class GameCommands(app_commands.Group):
             # Create response message
             msg_count = len(messages)
             await interaction.response.send_message(
-                f"Timer '{name}' updated at {time} with {msg_count} message{'s' if msg_count > 1 else ''}"
+                f"Timer '{name}' updated at {time} with {msg_count} message{'s' if msg_count != 1 else ''}"
             )
             
-        except ValueError:
-            await interaction.response.send_message("Invalid time format. Use M:SS (e.g., 5:30)")
         except Exception as e:
-            logger.error(f"Error adding timer: {e}")
+            logger.error("Error adding timer: %s", e)
             await interaction.response.send_message(f"Error adding timer: {str(e)}")
 
     @app_commands.command(name="remove_timer")
@@ -891,7 +1037,9 @@ class GameCommands(app_commands.Group):
             )
             return
             
-        removed_message = messages.pop(message_index)
+        # Slice out the message instead of popping from the stored list in place
+        removed_message = messages[message_index]
+        messages = messages[:message_index] + messages[message_index + 1:]
         
         if not messages:  # Don't allow empty message list
             messages = ["Timer event"]
@@ -911,73 +1059,42 @@ class GameCommands(app_commands.Group):
     @app_commands.command(name="list_timers")
     async def list_timers(self, interaction: discord.Interaction, category: Optional[str] = None):
         """List all configured timers, optionally filtered by category."""
-        timers = self.bot.config_manager.get_server_timers(interaction.guild.id, category)
+        # Sorted, pre-formatted fields are cached by the config manager
+        timer_fields = self.bot.config_manager.get_timer_listing(interaction.guild.id, category)
         
-        if not timers:
+        if not timer_fields:
             await interaction.response.send_message(
                 "No timers found" + (f" for category: {category}" if category else ""),
                 ephemeral=True
             )
             return
 
-        # Sort timers by time
-        sorted_timers = sorted(timers.items(), key=lambda x: x[1]['time'])
+        # Pages are built and packed into as few messages as Discord's embed
+        # limits allow, one batch at a time as they are sent
+        batches = _batch_embeds(_timer_pages(timer_fields, category))
+        await interaction.response.send_message(embeds=next(batches))
         
-        # Split timers into chunks of 25 for multiple embeds
-        chunk_size = 25
-        timer_chunks = [sorted_timers[i:i + chunk_size] for i in range(0, len(sorted_timers), chunk_size)]
-        
-        embeds = []
-        for i, chunk in enumerate(timer_chunks):
-            embed = discord.Embed(
-                title=f"Configured Timers (Page {i+1}/{len(timer_chunks)})",
-                color=discord.Color.blue()
+        # Send additional batches if they exist, in order so pages stay sequential
+        try:
+            for batch in batches:
+                await interaction.followup.send(embeds=batch)
+        except Exception as e:
+            logger.error("Error sending additional timer pages: %s", e)
+            await interaction.followup.send(
+                "Error displaying all timers. Some pages may be missing.",
+                ephemeral=True
             )
 
-            if category:
-                embed.description = f"Filtered by category: {category}"
-
-            # Add timer fields for this chunk
-            for name, timer in chunk:
-                minutes = timer['time'] // 60
-                seconds = timer['time'] % 60
-                messages = timer.get('messages', ['No message'])
-                
-                # Format message list
-                message_text = '\n'.join(f"{idx}. {msg}" 
-                                     for idx, msg in enumerate(messages))
-                
-                embed.add_field(
-                    name=f"{minutes:02d}:{seconds:02d} - {name}",
-                    value=f"Category: {timer.get('category', 'uncategorized')}\n{message_text}",
-                    inline=False
-                )
-            
-            embeds.append(embed)
-
-        # Send the first embed
-        await interaction.response.send_message(embed=embeds[0])
-        
-        # Send additional embeds if they exist
-        if len(embeds) > 1:
-            try:
-                for embed in embeds[1:]:
-                    await interaction.followup.send(embed=embed)
-            except Exception as e:
-                logger.error(f"Error sending additional timer pages: {e}")
-                await interaction.followup.send(
-                    "Error displaying all timers. Some pages may be missing.",
-                    ephemeral=True
-                )
-
     @app_commands.command(name="export_config")
     async def export_config(self, interaction: discord.Interaction):
         """Export the current server configuration."""
+        await interaction.response.defer(ephemeral=True)
+
         try:
             config = self.bot.config_manager.get_server_config(interaction.guild.id)
             
-            # Convert config to a formatted JSON string
-            config_str = json.dumps(config, indent=2)
+            # Formatted JSON bytes, ready for the attachment and cached between edits
+            config_bytes = self.bot.config_manager.get_export_bytes(interaction.guild.id)
             
             # Create an embed with the export details
             embed = discord.Embed(
@@ -988,7 +1105,8 @@ class GameCommands(app_commands.Group):
             
             # Add settings summary
             timer_count = len(config.get('timers', {}))
-            tts_settings = config['settings']['tts_settings']
+            settings = config['settings']
+            tts_settings = settings.get('tts_settings', {})
             
             embed.add_field(
                 name="Configuration Summary",
@@ -996,28 +1114,20 @@ class GameCommands(app_commands.Group):
                       f"• Language: {tts_settings.get('language', 'en')}\n"
                       f"• Accent: {tts_settings.get('accent', 'co.in')}\n"
                       f"• Speed: {tts_settings.get('speed', 1.0)}x\n"
-                      f"• Volume: {config['settings'].get('volume', 1.0)}",
+                      f"• Volume: {settings.get('volume', 1.0)}",
                 inline=False
             )
 
-            # Create a temporary file
-            with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as temp_file:
-                temp_file.write(config_str)
-                temp_file.flush()
-                
-                # Send the embed with the file
-                await interaction.response.send_message(
-                    embed=embed,
-                    file=discord.File(temp_file.name, filename=f"config_{interaction.guild.name}.json"),
-                    ephemeral=True
-                )
-
-            # Clean up
-            os.unlink(temp_file.name)
+            # Send the embed with the file straight from memory
+            await interaction.followup.send(
+                embed=embed,
+                file=discord.File(io.BytesIO(config_bytes), filename=f"config_{interaction.guild.id}.json"),
+                ephemeral=True
+            )
             
         except Exception as e:
-            logger.error(f"Error exporting config: {e}")
-            await interaction.response.send_message(
+            logger.error("Error exporting config: %s", e)
+            await interaction.followup.send(
                 "Error exporting configuration. Please try again.",
                 ephemeral=True
             )
@@ -1040,64 +1150,63 @@ class GameCommands(app_commands.Group):
                 ephemeral=True
             )
             return
+
+        # Parsing and validating a large file can take a while; acknowledge first
+        await interaction.response.defer(ephemeral=True)
             
         try:
-            # Check file size and type
-            if file.size > 1024 * 1024:  # 1MB limit
-                await interaction.response.send_message(
-                    "File too large. Configuration files should be under 1MB.",
+            # Check file type and size before downloading anything
+            if not file.filename.endswith('.json'):
+                await interaction.followup.send(
+                    "Please provide a .json file containing the configuration.",
                     ephemeral=True
                 )
                 return
 
-            if not file.filename.endswith('.json'):
-                await interaction.response.send_message(
-                    "Please provide a .json file containing the configuration.",
+            if file.size > _MAX_CONFIG_BYTES:
+                await interaction.followup.send(
+                    "File too large. Configuration files should be under 1MB.",
                     ephemeral=True
                 )
                 return
 
-            # Read and parse the file
+            # Read the file, then parse and validate it in a single worker
+            # thread hop to keep the loop free
             config_bytes = await file.read()
-            config_str = config_bytes.decode('utf-8')
             
-            try:
-                config_data = json.loads(config_str)
-            except json.JSONDecodeError:
-                await interaction.response.send_message(
-                    "Invalid JSON format. Please ensure the file contains valid JSON.",
-                    ephemeral=True
+            async with _IMPORT_SEMAPHORE:
+                is_valid, error_message, sanitized_config = await asyncio.to_thread(
+                    self.parse_config, config_bytes
                 )
-                return
-            
-            # Validate and sanitize the configuration
-            is_valid, error_message, sanitized_config = self.validate_config(config_data)
             
             if not is_valid:
-                await interaction.response.send_message(
-                    f"Invalid configuration: {error_message}",
-                    ephemeral=True
-                )
+                await interaction.followup.send(error_message, ephemeral=True)
                 return
             
             # Get current config if merging
             if merge:
                 current_config = self.bot.config_manager.get_server_config(interaction.guild.id)
+                existing_timers = current_config.get('timers', {})
+                incoming_timers = sanitized_config.get('timers', {})
                 
-                if keep_existing_timers:
-                    # Merge timers, keeping existing ones
-                    sanitized_config['timers'] = {
-                        **current_config.get('timers', {}),
-                        **sanitized_config.get('timers', {})
-                    }
+                # Merge timers, keeping existing ones; only copy when both sides have entries
+                if keep_existing_timers and existing_timers:
+                    timers = {**existing_timers, **incoming_timers} if incoming_timers else existing_timers
+                else:
+                    timers = incoming_timers
                 
-                # Merge settings
-                current_config['settings'].update(sanitized_config['settings'])
-                sanitized_config = current_config
+                # Merge settings into a new config so the live one is only
+                # replaced through set_server_config
+                existing_settings = current_config.get('settings', {})
+                incoming_settings = sanitized_config['settings']
+                sanitized_config = {
+                    **current_config,
+                    'timers': timers,
+                    'settings': {**existing_settings, **incoming_settings} if incoming_settings else existing_settings
+                }
             
             # Update the server configuration
-            self.bot.config_manager.configs[str(interaction.guild.id)] = sanitized_config
-            self.bot.config_manager.save_configs()
+            self.bot.config_manager.set_server_config(interaction.guild.id, sanitized_config)
             
             # Create summary embed
             embed = discord.Embed(
@@ -1106,36 +1215,38 @@ class GameCommands(app_commands.Group):
             )
             
             timer_count = len(sanitized_config.get('timers', {}))
-            tts_settings = sanitized_config['settings']['tts_settings']
-            voice_name = tts_settings.get('voice_name', 'en-IN-NeerjaNeural')
+            settings = sanitized_config['settings']
+            tts_settings = settings['tts_settings']
 
             embed.add_field(
                 name="Imported Configuration",
                 value=f"• {timer_count} total timers\n"
-                      f"• Voice: {voice_name}\n"
+                      f"• Voice: {tts_settings.get('voice_name', 'en-IN-NeerjaNeural')}\n"
                       f"• Speed: {tts_settings['speed']}x\n"
                       f"• Pitch: {tts_settings.get('pitch', 1.0)}x\n"
                       f"• Warning Time: {tts_settings.get('warning_time', 30)}s\n"
-                      f"• Volume: {sanitized_config['settings']['volume']:.1f}",
+                      f"• Volume: {settings['volume']:.1f}",
                 inline=False
             )
             
             if merge:
                 embed.add_field(
                     name="Merge Details",
-                    value="✓ Merged with existing configuration\n" +
-                          ("✓ Kept existing timers\n" if keep_existing_timers else "✗ Replaced existing timers\n"),
+                    value=_MERGE_DETAILS[bool(keep_existing_timers)],
                     inline=False
                 )
             
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 embed=embed,
                 ephemeral=True
             )
+
+            # Persist right away rather than waiting for the debounced save
+            await self.bot.config_manager.flush()
             
         except Exception as e:
-            logger.error(f"Error importing config: {e}")
-            await interaction.response.send_message(
+            logger.error("Error importing config: %s", e)
+            await interaction.followup.send(
                 "Error importing configuration. Please check the file and try again.",
                 ephemeral=True
             )
@@ -1153,79 +1264,82 @@ class GameCommands(app_commands.Group):
         """Say a message through TTS."""
         try:
             # First check for voice channel
-            if not interaction.user.voice:
+            voice_state = interaction.user.voice
+            if voice_state is None:
                 await interaction.response.send_message(
                     "You need to be in a voice channel!", 
                     ephemeral=True
                 )
                 return
 
-            # Send initial response before attempting voice connection
-            await interaction.response.send_message(
-                "Connecting to voice channel...", 
-                ephemeral=ephemeral
-            )
+            # Nothing to speak; don't pay for a voice connection or synthesis
+            message = message.strip()
+            if not message:
+                await interaction.response.send_message(
+                    "Message is empty.",
+                    ephemeral=True
+                )
+                return
+
+            # Acknowledge before attempting voice connection, which can take seconds
+            await interaction.response.defer(ephemeral=ephemeral, thinking=True)
 
             try:
-                voice_channel = interaction.user.voice.channel
+                voice_channel = voice_state.channel
                 voice_client = await self.bot.voice_service.ensure_voice_client(voice_channel)
                 
                 # Get server settings and play message
-                config = self.bot.config_manager.get_server_config(interaction.guild.id)
+                settings = self.bot.config_manager.get_announcement_settings(interaction.guild.id)
                 
                 # Update message about playing
                 await interaction.edit_original_response(
                     content=f"Playing: {message}"
                 )
                 
-                await self.bot.voice_service.play_announcement(
-                    voice_client,
-                    message,
-                    config['settings']
-                )
+                # Synthesis and playback take seconds; don't hold the command open for them
+                self._start_playback(interaction, voice_client, message, settings)
                 
             except asyncio.TimeoutError:
                 await interaction.edit_original_response(
                     content="Failed to connect to voice channel (timeout). Please try again."
                 )
             except Exception as e:
-                logger.error(f"Error in voice connection/playback: {e}")
+                logger.error("Error in voice connection/playback: %s", e)
                 await interaction.edit_original_response(
                     content=f"Error playing message: {str(e)}"
                 )
                 
         except Exception as e:
-            logger.error(f"Error in say command: {e}")
-            # Only try to respond if we haven't already
+            logger.error("Error in say command: %s", e)
+            # Respond directly if we haven't acknowledged yet, otherwise follow up
             if not interaction.response.is_done():
                 await interaction.response.send_message(
                     f"Error: {str(e)}", 
                     ephemeral=True
                 )
+            else:
+                await interaction.followup.send(f"Error: {str(e)}", ephemeral=True)
 
     @list_timers.autocomplete('category')
     async def category_autocomplete(self, 
                                   interaction: discord.Interaction, 
                                   current: str) -> List[app_commands.Choice[str]]:
         """Autocomplete for timer categories."""
-        categories = set()
-        config = self.bot.config_manager.get_server_config(interaction.guild.id)
-        
-        # Collect all unique categories
-        for timer in config.get('timers', {}).values():
-            if cat := timer.get('category'):
-                categories.add(cat)
-        
-        # Filter and sort categories based on current input
-        filtered = [
-            cat for cat in categories 
-            if current.lower() in cat.lower()
-        ]
-        filtered.sort()
+        categories = self.bot.config_manager.get_timer_categories(interaction.guild.id)
+
+        # Too short to narrow anything down; offer the first page as-is
+        if len(current) < _MIN_CATEGORY_PREFIX:
+            return [
+                app_commands.Choice(name=category, value=category)
+                for _, category in categories[:25]
+            ]
         
-        return [
-            app_commands.Choice(name=cat, value=cat)
-            for cat in filtered[:25]  # Discord limits to 25 choices
-        ]
-    
-    
+        # Categories are sorted by their lowercased name, so every prefix
+        # match sits in one contiguous run starting at the bisection point
+        current = current.lower()
+        choices = []
+        for category_lower, category in categories[bisect.bisect_left(categories, (current,)):]:
+            if not category_lower.startswith(current) or len(choices) == 25:
+                break  # Discord limits to 25 choices
+            choices.append(app_commands.Choice(name=category, value=category))
+        return choices
@@ -1,11 +1,21 @@
 from enum import Enum
+from dataclasses import dataclass
+import os
 import json
 import copy
+import bisect
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+from collections import Counter
+from typing import Dict, Any, List, Optional, Set, Tuple
 
 logger = logging.getLogger('PredTimer.Config')
 
+# Compact encoder for the store file (no indent keeps json on its C fast path)
+_encode_compact = json.JSONEncoder(separators=(',', ':')).encode
+# Human-readable encoder for exported configs, built once rather than per export
+_encode_indented = json.JSONEncoder(indent=2).encode
+
 class TimerCategory(Enum):
     EARLY_GAME = "early_game"
     MID_GAME = "mid_game"
@@ -504,40 +514,263 @@ DEFAULT_CONFIG = {
     'nitro_timers': {}
 }
 
+# tts_settings keys copied straight into AnnouncementSettings
+_ANNOUNCEMENT_TTS_KEYS = ('voice_name', 'speed', 'pitch', 'warning_time',
+                          'number_to_words', 'emphasis_volume')
+
+@dataclass(frozen=True, slots=True)
+class AnnouncementSettings:
+    """Immutable snapshot of the settings read on every voice announcement."""
+    volume: float = 1.0
+    voice_name: str = 'en-IN-NeerjaNeural'
+    speed: float = 1.0
+    pitch: float = 1.0
+    warning_time: int = 30
+    number_to_words: bool = True
+    emphasis_volume: float = 1.2
+    custom_pronunciations: Tuple[Tuple[str, str], ...] = ()
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any]) -> 'AnnouncementSettings':
+        """Build a snapshot from a server's 'settings' dict, filling in defaults."""
+        tts = settings.get('tts_settings', {})
+        # Slotted dataclasses don't expose defaults as class attributes, so only pass what's set
+        values = {key: tts[key] for key in _ANNOUNCEMENT_TTS_KEYS if key in tts}
+        if 'volume' in settings:
+            values['volume'] = settings['volume']
+        if 'custom_pronunciations' in tts:
+            values['custom_pronunciations'] = tuple(tts['custom_pronunciations'].items())
+        return cls(**values)
+
 class ConfigManager:
     """Handles server-specific configurations and settings."""
+
+    SAVE_DELAY = 0.5  # Seconds to coalesce config writes before flushing to disk
+    SAVE_RETRY_DELAY = 5.0  # Seconds before retrying a failed config write
     
     def __init__(self, config_file: str = 'server_configs.json'):
         self.config_file = config_file
         self.configs = self._load_configs()
+        self._migrated: set = set()  # Servers whose config has been migrated this session
+        # Resolved config dicts keyed by the ID exactly as callers pass it (int or str)
+        self._config_refs: Dict[Any, Dict[str, Any]] = {}
+        self._dirty = False
+        # Each server's serialized JSON, reused by saves until that server changes
+        self._fragments: Dict[str, str] = {}
+        self._save_handle: Optional[asyncio.TimerHandle] = None
+        self._save_lock = asyncio.Lock()
+        # Strong references keep background flushes from being garbage collected mid-write
+        self._flush_tasks: Set[asyncio.Task] = set()
+        # Per-server lookups derived from configs, dropped whenever that server changes
+        self._admin_role_sets: Dict[str, frozenset] = {}
+        self._authorized_user_sets: Dict[str, frozenset] = {}
+        self._announcement_settings: Dict[str, AnnouncementSettings] = {}
+        self._export_bytes: Dict[str, bytes] = {}
+        self._timer_listings: Dict[str, Dict[Optional[str], Tuple[Tuple[str, str], ...]]] = {}
+        # (time, timer name) pairs kept in sorted order as timers are added and removed
+        self._timer_order: Dict[str, List[Tuple[int, str]]] = {}
+        # (lowercased category, category) pairs kept in sorted order for prefix lookups
+        self._timer_categories: Dict[str, List[Tuple[str, str]]] = {}
+        # How many timers use each category, maintained alongside _timer_categories
+        self._category_counts: Dict[str, Counter] = {}
         logger.info("ConfigManager initialized")
 
-    def _load_configs(self) -> Dict[str, Any]:
-        """Load configurations from file."""
+    def _invalidate_caches(self, server_id: str, categories: bool = True,
+                           timer_order: bool = True) -> None:
+        """
+        Drop cached lookups derived from a server's configuration.
+        Callers that patch the sorted timer or category indexes in place can keep them.
+        """
+        self._admin_role_sets.pop(server_id, None)
+        self._authorized_user_sets.pop(server_id, None)
+        self._announcement_settings.pop(server_id, None)
+        self._export_bytes.pop(server_id, None)
+        self._timer_listings.pop(server_id, None)
+        if categories:
+            self._timer_categories.pop(server_id, None)
+            self._category_counts.pop(server_id, None)
+        if timer_order:
+            self._timer_order.pop(server_id, None)
+
+    def _unindex_timer(self, server_id: str, timer_time: int, timer_name: str) -> None:
+        """Remove a timer from a server's cached time-sorted index."""
+        order = self._timer_order.get(server_id)
+        if order is None:
+            return
+        entry = (timer_time, timer_name)
+        index = bisect.bisect_left(order, entry)
+        if index < len(order) and order[index] == entry:
+            del order[index]
+
+    def _count_timer_category(self, server_id: str, category: str, delta: int) -> None:
+        """
+        Adjust how many timers use a category, adding it to or dropping it from
+        the server's cached sorted category index as its count leaves or reaches zero.
+        """
+        counts = self._category_counts.get(server_id)
+        if counts is None or not category:
+            return
+        previous = counts[category]
+        categories = self._timer_categories[server_id]
+        entry = (category.lower(), category)
+        if previous + delta > 0:
+            counts[category] = previous + delta
+            if previous == 0:  # First timer using this category
+                bisect.insort(categories, entry)
+            return
+        counts.pop(category, None)
+        index = bisect.bisect_left(categories, entry)
+        if index < len(categories) and categories[index] == entry:
+            del categories[index]
+
+    def save_configs(self, server_id: Optional[str] = None) -> None:
+        """
+        Save current configurations to file.
+        Pass the server whose config changed so only it is re-serialized;
+        without one, every server is.
+        Inside the event loop writes are debounced and run in a worker thread;
+        without a running loop the file is written immediately.
+        """
+        if server_id is None:
+            self._fragments.clear()
+        else:
+            self._fragments.pop(str(server_id), None)
+        self._dirty = True
         try:
-            with open(self.config_file, 'r') as f:
-                configs = json.load(f)
-                logger.info(f"Loaded configurations for {len(configs)} servers")
-                return configs
-        except FileNotFoundError:
-            logger.info("No existing config file found, creating new configuration")
-            return {}
-        except json.JSONDecodeError:
-            logger.error("Error decoding config file, creating new configuration")
-            return {}
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._dirty = False
+            self._write_configs(self._serialize_configs())
+            return
+
+        if self._save_handle is None:
+            self._save_handle = loop.call_later(self.SAVE_DELAY, self._schedule_flush)
+
+    def _schedule_flush(self) -> None:
+        """Start a background flush once the debounce delay has elapsed."""
+        self._save_handle = None
+        task = asyncio.create_task(self.flush())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def flush(self) -> None:
+        """Write any pending configuration changes to disk now."""
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+            self._save_handle = None
+
+        async with self._save_lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            # Serialize on the loop so the snapshot can't change mid-write
+            data = self._serialize_configs()
+            try:
+                await asyncio.to_thread(self._write_configs, data)
+            except Exception as e:
+                self._dirty = True
+                logger.error(f"Error saving configurations: {e}")
+                # Retry later rather than leaving the change only in memory
+                if self._save_handle is None:
+                    self._save_handle = asyncio.get_running_loop().call_later(
+                        self.SAVE_RETRY_DELAY, self._schedule_flush
+                    )
+
+    def _serialize_configs(self) -> str:
+        """
+        Serialize all configurations for the store file, re-encoding only
+        servers that changed since the last save.
+        Written compactly: json only uses its C encoder when no indent is requested,
+        and the file is edited through export/import rather than by hand.
+        """
+        fragments = self._fragments
+        parts = []
+        for server_id, config in self.configs.items():
+            fragment = fragments.get(server_id)
+            if fragment is None:
+                fragment = fragments[server_id] = _encode_compact(config)
+            parts.append(f"{_encode_compact(server_id)}:{fragment}")
+        return '{' + ','.join(parts) + '}'
 
-    def save_configs(self) -> None:
-        """Save current configurations to file."""
-        with open(self.config_file, 'w') as f:
-            json.dump(self.configs, f, indent=4)
+    def _write_configs(self, data: str) -> None:
+        """Atomically replace the config file with the serialized data."""
+        temp_file = f"{self.config_file}.tmp"
+        with open(temp_file, 'w') as f:
+            f.write(data)
+        os.replace(temp_file, self.config_file)
+
+    def _ensure_config(self, server_id: str) -> Dict[str, Any]:
+        """
+        Get a server's configuration, creating it from defaults if missing.
+        Stored configs are migrated lazily the first time they're accessed, so
+        'settings' with its 'tts_settings' and admin fields is always present.
+        """
+        config = self.configs.get(server_id)
+        if config is None:
+            config = self.configs[server_id] = copy.deepcopy(DEFAULT_CONFIG)
+            self._migrated.add(server_id)
+            self.save_configs(server_id)
+        elif server_id not in self._migrated:
+            self._migrated.add(server_id)
+            migrated = self._migrate_config(config)
+            if migrated != config:
+                config = self.configs[server_id] = migrated
+                self.save_configs(server_id)
+        return config
 
     def get_server_config(self, server_id: int) -> Dict[str, Any]:
         """Get configuration for a specific server."""
+        config = self._config_refs.get(server_id)
+        if config is None:
+            config = self._config_refs[server_id] = self._ensure_config(str(server_id))
+        return config
+
+    def set_server_config(self, server_id: int, config: Dict[str, Any]) -> None:
+        """Replace the whole configuration for a specific server."""
+        server_id = str(server_id)
+        self._config_refs.pop(server_id, None)
+        self._config_refs.pop(int(server_id), None)
+        self.configs[server_id] = config
+        self._migrated.add(server_id)
+        self._invalidate_caches(server_id)
+        self.save_configs(server_id)
+
+    def get_admin_role_set(self, server_id: int) -> frozenset:
+        """Get a server's admin role IDs as a cached frozenset."""
+        server_id = str(server_id)
+        admin_roles = self._admin_role_sets.get(server_id)
+        if admin_roles is None:
+            config = self.get_server_config(server_id)
+            admin_roles = frozenset(config['settings']['admin_roles'])
+            self._admin_role_sets[server_id] = admin_roles
+        return admin_roles
+
+    def get_authorized_user_set(self, server_id: int) -> frozenset:
+        """
+        Get the user IDs granted bot admin access by a server's settings
+        (admin users, secondary owners and the bot inviter) as a cached frozenset.
+        """
         server_id = str(server_id)
-        if server_id not in self.configs:
-            self.configs[server_id] = copy.deepcopy(DEFAULT_CONFIG)
-            self.save_configs()
-        return self.configs[server_id]
+        authorized_users = self._authorized_user_sets.get(server_id)
+        if authorized_users is None:
+            settings = self.get_server_config(server_id)['settings']
+            users = set(settings['admin_users'])
+            users.update(settings['secondary_owners'])
+            bot_inviter = settings['bot_inviter']
+            if bot_inviter:
+                users.add(bot_inviter)
+            authorized_users = self._authorized_user_sets[server_id] = frozenset(users)
+        return authorized_users
+
+    def get_announcement_settings(self, server_id: int) -> AnnouncementSettings:
+        """Get a server's announcement settings as a cached immutable snapshot."""
+        server_id = str(server_id)
+        settings = self._announcement_settings.get(server_id)
+        if settings is None:
+            config = self.get_server_config(server_id)
+            settings = AnnouncementSettings.from_settings(config['settings'])
+            self._announcement_settings[server_id] = settings
+        return settings
     
     def _migrate_config(self, config: dict) -> dict:
         """Migrate old config format to new format."""
@@ -602,6 +835,23 @@ class ConfigManager:
             if 'bot_inviter' not in migrated['settings']:
                 migrated['settings']['bot_inviter'] = None
                 was_migrated = True
+
+            # Legacy or hand-edited files may store IDs as strings; admin lists
+            # are written back sorted, which fails on a mix of int and str
+            for key in ('admin_roles', 'admin_users', 'secondary_owners'):
+                ids = migrated['settings'][key]
+                normalized = [
+                    int(value) for value in (ids if isinstance(ids, list) else [])
+                    if type(value) is int or (isinstance(value, str) and value.isdecimal())
+                ]
+                if normalized != ids:
+                    migrated['settings'][key] = normalized
+                    was_migrated = True
+
+            bot_inviter = migrated['settings']['bot_inviter']
+            if isinstance(bot_inviter, str):
+                migrated['settings']['bot_inviter'] = int(bot_inviter) if bot_inviter.isdecimal() else None
+                was_migrated = True
                 
             if was_migrated:
                 logger.info("Config was migrated to new format")
@@ -612,25 +862,12 @@ class ConfigManager:
             return config  # Return original if migration fails
 
     def _load_configs(self) -> Dict[str, Any]:
-        """Load configurations from file with migration."""
+        """Load configurations from file; each server is migrated on first access."""
         try:
             with open(self.config_file, 'r') as f:
                 configs = json.load(f)
-                migrated_configs = {}
-                
-                # Migrate each server's config
-                for server_id, config in configs.items():
-                    logger.info(f"Checking config for server {server_id}")
-                    migrated_configs[server_id] = self._migrate_config(config)
-                
-                # If any configs were migrated, save the changes
-                if configs != migrated_configs:
-                    logger.info("Saving migrated configurations")
-                    with open(self.config_file, 'w') as f:
-                        json.dump(migrated_configs, f, indent=4)
-                
                 logger.info(f"Loaded configurations for {len(configs)} servers")
-                return migrated_configs
+                return configs
         except FileNotFoundError:
             logger.info("No existing config file found, creating new configuration")
             return {}
@@ -640,20 +877,29 @@ class ConfigManager:
 
     def update_server_setting(self, server_id: int, path: str, value: Any) -> None:
         """Update a specific setting for a server using dot notation path."""
+        self.update_server_settings(server_id, {path: value})
+
+    def update_server_settings(self, server_id: int, updates: Dict[str, Any]) -> None:
+        """
+        Update several settings for a server at once, keyed by dot notation path.
+        All values are applied before caches are dropped and a single save is scheduled.
+        """
         server_id = str(server_id)
-        if server_id not in self.configs:
-            self.configs[server_id] = copy.deepcopy(DEFAULT_CONFIG)
+        config = self._ensure_config(server_id)
+
+        for path, value in updates.items():
+            current = config
+            *parts, last = path.split('.')
 
-        current = self.configs[server_id]
-        *parts, last = path.split('.')
+            for part in parts:
+                if part not in current:
+                    current[part] = {}
+                current = current[part]
 
-        for part in parts:
-            if part not in current:
-                current[part] = {}
-            current = current[part]
+            current[last] = value
 
-        current[last] = value
-        self.save_configs()
+        self._invalidate_caches(server_id)
+        self.save_configs(server_id)
 
     def remove_timer(self, server_id: int, timer_name: str) -> bool:
         """Remove a timer from a server's configuration."""
@@ -661,8 +907,11 @@ class ConfigManager:
         if (server_id in self.configs and 
             'timers' in self.configs[server_id] and 
             timer_name in self.configs[server_id]['timers']):
-            del self.configs[server_id]['timers'][timer_name]
-            self.save_configs()
+            removed = self.configs[server_id]['timers'].pop(timer_name)
+            self._invalidate_caches(server_id, categories=False, timer_order=False)
+            self._unindex_timer(server_id, removed.get('time', 0), timer_name)
+            self._count_timer_category(server_id, removed.get('category'), -1)
+            self.save_configs(server_id)
             return True
         return False
     
@@ -681,7 +930,86 @@ class ConfigManager:
                 if timer.get('category') == category
             }
         return timers
+
+    def get_timer_listing(self, server_id: int,
+                          category: Optional[str] = None) -> Tuple[Tuple[str, str], ...]:
+        """
+        Get a server's timers as pre-formatted (field name, field value) pairs
+        sorted by time. The listing is cached until the server's config changes.
+        """
+        server_id = str(server_id)
+        category = category or None
+        if category is not None:
+            # category is free-form user input; only categories the server's
+            # timers actually use get a cache entry, anything else lists nothing
+            self.get_timer_categories(server_id)
+            if category not in self._category_counts[server_id]:
+                return ()
+        listings = self._timer_listings.setdefault(server_id, {})
+        listing = listings.get(category)
+        if listing is None:
+            timers = self.get_server_config(server_id).get('timers', {})
+            fields = []
+            for _, name in self.get_timer_order(server_id):
+                timer = timers[name]
+                if category and timer.get('category') != category:
+                    continue
+                minutes, seconds = divmod(timer['time'], 60)
+                messages = timer.get('messages', ['No message'])
+                # A list lets join size the result in one pass instead of draining a generator
+                message_text = '\n'.join([f"{idx}. {msg}"
+                                          for idx, msg in enumerate(messages)])
+                fields.append((
+                    f"{minutes:02d}:{seconds:02d} - {name}",
+                    f"Category: {timer.get('category', 'uncategorized')}\n{message_text}"
+                ))
+            listing = listings[category] = tuple(fields)
+        return listing
     
+    def get_export_bytes(self, server_id: int) -> bytes:
+        """
+        Get a server's configuration as indented UTF-8 JSON for export,
+        cached until the config changes so repeated exports skip serialization.
+        """
+        server_id = str(server_id)
+        data = self._export_bytes.get(server_id)
+        if data is None:
+            config = self.get_server_config(server_id)
+            data = self._export_bytes[server_id] = _encode_indented(config).encode('utf-8')
+        return data
+
+    def get_timer_order(self, server_id: int) -> List[Tuple[int, str]]:
+        """
+        Get a server's timers as (time, timer name) pairs sorted by time.
+        The list is kept up to date as timers change; treat it as read-only.
+        """
+        server_id = str(server_id)
+        order = self._timer_order.get(server_id)
+        if order is None:
+            timers = self.get_server_config(server_id).get('timers', {})
+            order = self._timer_order[server_id] = sorted(
+                (timer.get('time', 0), name) for name, timer in timers.items()
+            )
+        return order
+
+    def get_timer_categories(self, server_id: int) -> List[Tuple[str, str]]:
+        """
+        Get the unique categories used by a server's timers as
+        (lowercased category, category) pairs sorted for bisecting.
+        The list is kept up to date as timers change; treat it as read-only.
+        """
+        server_id = str(server_id)
+        categories = self._timer_categories.get(server_id)
+        if categories is None:
+            timers = self.get_server_config(server_id).get('timers', {})
+            counts = self._category_counts[server_id] = Counter(
+                timer['category'] for timer in timers.values() if timer.get('category')
+            )
+            categories = self._timer_categories[server_id] = sorted(
+                (category.lower(), category) for category in counts
+            )
+        return categories
+
     def _validate_timer_structure(self, timer_data: dict) -> dict:
         """Convert old timer format to new format if needed and validate structure."""
         validated = {
@@ -706,22 +1034,39 @@ class ConfigManager:
                 messages: list[str] | str, category: str) -> None:
         """Update or create a timer for a server."""
         server_id = str(server_id)
-        if server_id not in self.configs:
-            self.configs[server_id] = copy.deepcopy(DEFAULT_CONFIG)
+        config = self._ensure_config(server_id)
 
-        if 'timers' not in self.configs[server_id]:
-            self.configs[server_id]['timers'] = {}
+        if 'timers' not in config:
+            config['timers'] = {}
 
         # Handle single message vs list of messages
         if isinstance(messages, str):
             messages = [messages]
 
-        self.configs[server_id]['timers'][timer_name] = {
+        previous = config['timers'].get(timer_name)
+        timer = {
             'time': time,
             'messages': messages,
             'category': category
         }
-        self.save_configs()
+        # Re-saving an identical timer would only invalidate caches and rewrite the file
+        if previous == timer:
+            return
+        config['timers'][timer_name] = timer
+
+        # Patch the sorted category and timer indexes in place
+        self._invalidate_caches(server_id, categories=False, timer_order=False)
+        if previous is not None:
+            self._count_timer_category(server_id, previous.get('category'), -1)
+        self._count_timer_category(server_id, category, 1)
+
+        # Move the timer to its new slot in the time-sorted index
+        order = self._timer_order.get(server_id)
+        if order is not None:
+            if previous is not None:
+                self._unindex_timer(server_id, previous.get('time', 0), timer_name)
+            bisect.insort(order, (time, timer_name))
+        self.save_configs(server_id)
 
     def sync_discord_admins(self, guild) -> int:
         """
@@ -729,8 +1074,8 @@ class ConfigManager:
         Returns the number of new admins added.
         """
         server_id = str(guild.id)
-        config = self.get_server_config(guild.id)
-        admin_users = set(config.get('settings', {}).get('admin_users', []))
+        settings = self.get_server_config(guild.id)['settings']
+        admin_users = set(settings['admin_users'])
         initial_count = len(admin_users)
 
         # Always include server owner
@@ -743,9 +1088,7 @@ class ConfigManager:
                 logger.info(f"Auto-added Discord admin: {member.name} ({member.id}) to guild {guild.id}")
 
         # Add secondary owners if configured
-        secondary_owners = config.get('settings', {}).get('secondary_owners', [])
-        for owner_id in secondary_owners:
-            admin_users.add(owner_id)
+        admin_users.update(settings['secondary_owners'])
 
         # Update config if there are changes
         new_count = len(admin_users)
@@ -753,7 +1096,7 @@ class ConfigManager:
             self.update_server_setting(
                 guild.id,
                 'settings.admin_users',
-                list(admin_users)
+                sorted(admin_users)
             )
             logger.info(f"Synced {new_count - initial_count} new admin(s) for guild {guild.id}")
 
@@ -764,21 +1107,23 @@ class ConfigManager:
         Record who invited the bot and grant them admin access.
         """
         server_id = str(guild_id)
-        config = self.get_server_config(guild_id)
+        settings = self.get_server_config(guild_id)['settings']
+
+        updates = {}
 
         # Record the inviter
-        current_inviter = config.get('settings', {}).get('bot_inviter')
-        if current_inviter is None:
-            self.update_server_setting(guild_id, 'settings.bot_inviter', inviter_id)
-            logger.info(f"Recorded bot inviter: {inviter_id} for guild {guild_id}")
+        if settings['bot_inviter'] is None:
+            updates['settings.bot_inviter'] = inviter_id
 
         # Add inviter to admin users
-        admin_users = set(config.get('settings', {}).get('admin_users', []))
+        admin_users = set(settings['admin_users'])
         if inviter_id not in admin_users:
-            admin_users.add(inviter_id)
-            self.update_server_setting(
-                guild_id,
-                'settings.admin_users',
-                list(admin_users)
-            )
+            updates['settings.admin_users'] = sorted(admin_users | {inviter_id})
+
+        # Apply both changes with a single save
+        if updates:
+            self.update_server_settings(guild_id, updates)
+        if 'settings.bot_inviter' in updates:
+            logger.info(f"Recorded bot inviter: {inviter_id} for guild {guild_id}")
+        if 'settings.admin_users' in updates:
             logger.info(f"Granted admin access to bot inviter: {inviter_id} for guild {guild_id}")
@@ -73,19 +73,14 @@ class GameTimer:
         self.announced_events: Set[str] = set()
         logger.info("GameTimer initialized")
 
-    def start(self, time_str: str, mode: str = 'standard') -> None:
-        """Start the timer from a specific time point."""
-        try:
-            minutes, seconds = map(int, time_str.split(':'))
-            current_time = datetime.now()
-            self.start_time = current_time - timedelta(minutes=minutes, seconds=seconds)
-            self.is_active = True
-            self.mode = mode
-            self.announced_events.clear()
-            logger.info(f"Timer started at {time_str} in {mode} mode")
-        except ValueError as e:
-            logger.error(f"Error parsing time string: {e}")
-            raise
+    def start(self, elapsed: int, mode: str = 'standard') -> None:
+        """Start the timer from a specific time point, given in seconds of game time."""
+        self.start_time = datetime.now() - timedelta(seconds=elapsed)
+        self.is_active = True
+        self.mode = mode
+        self.announced_events.clear()
+        minutes, seconds = divmod(elapsed, 60)
+        logger.info(f"Timer started at {minutes}:{seconds:02d} in {mode} mode")
 
     def get_game_time(self) -> int:
         """Get current game time in seconds."""
@@ -162,6 +157,14 @@ class PredecessorBot(commands.Bot):
                 logger.error(f"Error in setup_hook: {e}", exc_info=True)
                 raise
 
+    async def close(self) -> None:
+        """Flush pending config changes before shutting down."""
+        try:
+            await self.config_manager.flush()
+        except Exception as e:
+            logger.error(f"Error flushing configs on shutdown: {e}")
+        await super().close()
+
     async def _detect_bot_inviter(self, guild: discord.Guild) -> None:
         """
         Try to detect who invited the bot by checking audit logs.
@@ -169,7 +172,7 @@ class PredecessorBot(commands.Bot):
         try:
             # Check if we already have an inviter recorded
             config = self.config_manager.get_server_config(guild.id)
-            existing_inviter = config.get('settings', {}).get('bot_inviter')
+            existing_inviter = config['settings']['bot_inviter']
             if existing_inviter is not None:
                 logger.debug(f"Bot inviter already recorded for guild {guild.id}: {existing_inviter}")
                 return
@@ -240,12 +243,11 @@ class PredecessorBot(commands.Bot):
             current_time = self.timer.get_game_time()
             
             for voice_client in self.voice_clients:
-                server_config = self.config_manager.get_server_config(voice_client.guild.id)
                 active_mode = self.timer.mode if hasattr(self.timer, 'mode') else mode
                 timers = self.config_manager.get_server_timers(voice_client.guild.id, mode=active_mode)
-                settings = server_config.get('settings', {})
+                settings = self.config_manager.get_announcement_settings(voice_client.guild.id)
                 
-                warning_time = settings.get('tts_settings', {}).get('warning_time', 30)
+                warning_time = settings.warning_time
                 
                 for event_name, timer_config in timers.items():
                     event_id = f"{voice_client.guild.id}_{event_name}"
@@ -3,10 +3,11 @@ import logging
 import edge_tts
 import discord
 import asyncio
-from typing import Dict, Any
 import tempfile
 from pathlib import Path
 
+from config import AnnouncementSettings
+
 logger = logging.getLogger('PredTimer.Services')
 
 class TTSService:
@@ -17,18 +18,16 @@ class TTSService:
         self.temp_dir.mkdir(exist_ok=True)
         logger.info("TTSService initialized with Edge-TTS")
 
-    async def create_tts_message(self, message: str, settings: Dict[str, Any]) -> str:
+    async def create_tts_message(self, message: str, settings: AnnouncementSettings) -> str:
         """Create a TTS audio file from the given message using Edge-TTS."""
         try:
-            tts_settings = settings.get('tts_settings', {})
-
             # Pre-process message based on settings
-            processed_message = self._process_message(message, tts_settings)
+            processed_message = self._process_message(message, settings)
 
             # Get voice settings
-            voice_name = tts_settings.get('voice_name', 'en-IN-NeerjaNeural')
-            rate = self._get_rate_string(tts_settings.get('speed', 1.0))
-            pitch = self._get_pitch_string(tts_settings.get('pitch', 1.0))
+            voice_name = settings.voice_name
+            rate = self._get_rate_string(settings.speed)
+            pitch = self._get_pitch_string(settings.pitch)
 
             # Generate unique filename
             filename = self.temp_dir / f"temp_{hash(processed_message)}_{voice_name.replace('-', '_')}.mp3"
@@ -62,19 +61,18 @@ class TTSService:
         percentage = int((pitch - 1.0) * 100)
         return f"{percentage:+d}Hz"
 
-    def _process_message(self, message: str, settings: Dict[str, Any]) -> str:
+    def _process_message(self, message: str, settings: AnnouncementSettings) -> str:
         """Process message according to TTS settings."""
         # Convert numbers to words if enabled
-        if settings.get('number_to_words', True):
+        if settings.number_to_words:
             message = self._convert_numbers_to_words(message)
         
         # Apply custom pronunciations
-        replacements = settings.get('custom_pronunciations', {})
-        for old, new in replacements.items():
+        for old, new in settings.custom_pronunciations:
             message = message.replace(old, new)
         
         # Add emphasis for important words if enabled
-        if settings.get('emphasis_volume', 1.2) > 1.0:
+        if settings.emphasis_volume > 1.0:
             message = self._add_emphasis(message)
         
         return message
@@ -174,11 +172,18 @@ class VoiceService:
             voice_client = channel.guild.voice_client
             
             if voice_client:
-                # If we're already in the right channel, return the client
-                if voice_client.channel.id == channel.id and not force_new:
+                # is_connected() is local state, so reusing a live client costs no round-trip
+                if voice_client.is_connected() and not force_new:
+                    # If we're already in the right channel, return the client
+                    if voice_client.channel.id == channel.id:
+                        return voice_client
+
+                    # Switch channels on the existing session instead of reconnecting
+                    await asyncio.wait_for(voice_client.move_to(channel), timeout=timeout)
+                    await self.reset_inactivity_timer(voice_client)
                     return voice_client
                     
-                # Otherwise, disconnect from the current channel
+                # Otherwise, drop the stale or unwanted client
                 await voice_client.disconnect(force=True)
             
             # Connect to the new channel with timeout
@@ -206,7 +211,7 @@ class VoiceService:
     async def play_announcement(self,
                               voice_client: discord.VoiceClient,
                               message: str,
-                              settings: Dict[str, Any]) -> None:
+                              settings: AnnouncementSettings) -> None:
         """Play a TTS announcement in a voice channel."""
         try:
             if voice_client.is_playing():
@@ -216,7 +221,7 @@ class VoiceService:
             filename = await self.tts_service.create_tts_message(message, settings)
 
             # Get volume setting (speed/pitch already handled by Edge-TTS)
-            volume = settings.get('volume', 1.0)
+            volume = settings.volume
 
             # Build FFmpeg options - Edge-TTS handles speed/pitch internally
             options = {